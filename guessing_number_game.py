@@ -25,172 +25,401 @@ This project demonstrates:
 - Basic game state management
 """
 
+import io
+import os
 import random
+import sys
+
+# --- Output Buffering ---
+STDOUT_BUFFER_SIZE = 65536   # Block buffer size used when stdout is not a terminal
+
+# --- Target Number Buffer ---
+TARGET_BUFFER_SIZE = 64   # Targets generated per refill
+
+# --- Lookup Tables ---
+_YESNO = {"yes": "yes", "no": "no", "y": "yes", "n": "no"}   # Accepted answers → canonical form
+_HINTS = ("⬆️ Higher!\n".encode("utf-8"), "⬇️ Lower!\n".encode("utf-8"))   # Indexed by (guess > number)
+
+# --- Pre-encoded Messages ---
+_B_WELCOME = "🎮 Welcome to the Guessing Number Game!\n".encode("utf-8")
+_B_CORRECT = "🎉 Correct!\n".encode("utf-8")
+_B_PLAY_PROMPT = "Do you want to play? (yes/no): ".encode("utf-8")
+_B_AGAIN_PROMPT = "Play again? (yes/no): ".encode("utf-8")
+_B_GUESS_PROMPT = "Guess a number between 1 and 10: ".encode("utf-8")
+_B_INVALID_CHOICE = "❌ Invalid choice. Please type 'yes' or 'no'.\n".encode("utf-8")
+_B_OUT_OF_RANGE = "❌ Please enter a number between 1 and 10.\n".encode("utf-8")
+_B_INVALID_NUMBER = "❌ Invalid input. Please enter a number.\n".encode("utf-8")
+
+# --- Output Helpers ---
+def _buffer_stdout():
+    """
+    Block-buffer stdout with a larger buffer when it is piped/redirected.
+
+    Leaves sys.stdout untouched when it is a terminal or has no real
+    file descriptor (e.g. io.StringIO, captured output in IDEs/tests).
+    """
+    stream = sys.stdout
+    try:
+        if stream.isatty():
+            return
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation derives from both OSError and ValueError
+        return
+    stream.flush()
+    sys.stdout = io.TextIOWrapper(
+        open(fd, "wb", buffering=STDOUT_BUFFER_SIZE, closefd=False),
+        encoding="utf-8",
+        write_through=False,
+    )
+
+#-------------------------------------------------------------------------#
+
+class _TextSink:
+    """
+    Byte-stream adapter for text-only stdout replacements (e.g. io.StringIO).
+
+    Decodes the pre-encoded game messages back to str before writing.
+    """
 
-# --- Global Variables ---
-score = 0              # Total number of correct guesses
-total_attempts = 0     # Total number of guesses across all rounds
-win_streak = 0         # Number of consecutive round wins
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data):
+        self._stream.write(data.decode("utf-8"))
+
+    def flush(self):
+        self._stream.flush()
+
+#-------------------------------------------------------------------------#
+
+def _stdout_bytes():
+    """
+    Return a binary stream for the current sys.stdout.
+
+    Game output is written as pre-encoded UTF-8 bytes straight to the
+    binary layer, skipping the text encoder. Pending text output is
+    flushed first so both stay in order.
+
+    Returns:
+        A stream with write(bytes) and flush() methods.
+    """
+    stream = sys.stdout
+    stream.flush()
+    buffer = getattr(stream, "buffer", None)
+    return buffer if buffer is not None else _TextSink(stream)
+
+# --- Random Number Generator ---
+def _make_rng():
+    """
+    Create a dedicated random number generator for the game.
+
+    Set GUESS_SEED to an integer for reproducible sessions; an empty or
+    missing value means an unseeded RNG.
+
+    Returns:
+        random.Random: The RNG used to draw target numbers.
+    """
+    seed = os.environ.get("GUESS_SEED", "").strip()
+    if not seed:
+        return random.Random()
+    try:
+        return random.Random(int(seed))
+    except ValueError:
+        sys.exit(f"❌ GUESS_SEED must be an integer, got {seed!r}.")
 
 # --- Game Functions ---
-def get_yes_no(prompt):
+def _prompt(prompt, out):
+    """
+    Write a prompt and read one line from standard input.
+
+    A lighter replacement for input(): writes the prompt straight to
+    stdout and reads with sys.stdin.readline().
+
+    Args:
+        prompt (bytes): The UTF-8 encoded text displayed before reading.
+        out: Binary stdout stream, flushed before reading.
+
+    Returns:
+        str: The line entered, without the trailing newline.
+
+    Raises:
+        EOFError: If standard input is exhausted.
+    """
+    out.write(prompt)
+    out.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+#-------------------------------------------------------------------------#
+
+def get_yes_no(prompt, out=None):
     """
     Ask the player a Yes/No question.
 
-    Keeps looping until the input is either 'yes' or 'no'.
+    Keeps looping until the input is either 'yes' or 'no'
+    ('y' and 'n' are accepted as shorthands).
 
     Args:
-        prompt (str): The question displayed to the player.
+        prompt (str or bytes): The question displayed to the player
+            (bytes must be UTF-8 encoded).
+        out (optional): Binary stdout stream. Defaults to the current sys.stdout.
 
     Returns:
         str: Either "yes" or "no".
     """
+    if out is None:
+        out = _stdout_bytes()
+    if isinstance(prompt, str):
+        prompt = prompt.encode("utf-8")
+    _read, _write, _answers = _prompt, out.write, _YESNO   # Local aliases for the loop
     while True:
-        ans = input(prompt).strip().lower()
-        if ans in ("yes", "no"):
-            return ans
-        print("❌ Invalid choice. Please type 'yes' or 'no'.")
+        ans = _read(prompt, out).strip().lower()
+        try:
+            return _answers[ans]
+        except KeyError:
+            pass
+        _write(_B_INVALID_CHOICE)
 
 #-------------------------------------------------------------------------#
 
-def get_user_guess():
+def get_user_guess(out=None) -> int:
     """
     Ask the player to guess a number between 1 and 10.
 
     Keeps looping until the user provides a valid integer
     within the range [1, 10].
 
+    Args:
+        out (optional): Binary stdout stream. Defaults to the current sys.stdout.
+
     Returns:
         int: The valid guess entered by the user.
     """
+    if out is None:
+        out = _stdout_bytes()
+    _read, _write, _int = _prompt, out.write, int   # Local aliases for the loop
     while True:
-        try:
-            guess = int(input("Guess a number between 1 and 10: "))
-            if 1 <= guess <= 10:
-                return guess
-            print("❌ Please enter a number between 1 and 10.")
-        except ValueError:
-            print("❌ Invalid input. Please enter a number.")
+        text = _read(_B_GUESS_PROMPT, out).strip()
+        guess = None
+        if text[-1:].isdecimal():
+            # int() needs a trailing digit, so most typos skip the exception path
+            try:
+                guess = _int(text)
+            except ValueError:
+                pass   # e.g. "1x2", or more digits than int() accepts
+        if guess is None:
+            _write(_B_INVALID_NUMBER)
+        elif 1 <= guess <= 10:
+            return guess
+        else:
+            _write(_B_OUT_OF_RANGE)
             
+#-------------------------------------------------------------------------#
+
+def _attempt(number, out):
+    """
+    Play a single guess against the target number.
+
+    Prints a "Higher" / "Lower" hint when the guess is wrong.
+
+    Args:
+        number (int): The target number for the current round.
+        out: Binary stdout stream.
+
+    Returns:
+        bool: True if the guess was correct, False otherwise.
+    """
+    guess = get_user_guess(out)
+    if guess == number:
+        return True
+    out.write(_HINTS[guess > number])
+    return False
+
 #==========================================================================#
 
-def progress_bar(streak, max_streak=5, length=10):
+# Full and empty bars of the default length, sliced to build the table below
+_FULL = "█" * 10
+_EMPTY = "-" * 10
+
+# Precomputed bars for the default settings (streak 0..5, length 10)
+_BARS = tuple(
+    f"[{_FULL[:s * 10 // 5]}{_EMPTY[s * 10 // 5:]}] {s}/5"
+    for s in range(6)
+)
+
+def progress_bar(streak: int, max_streak: int = 5, length: int = 10) -> str:
     """
     Display a progress bar for the win streak.
 
     Args:
-        streak (int): Current number of consecutive wins.
+        streak (int): Current number of consecutive wins (>= 0).
         max_streak (int, optional): Required streak to win the game. Defaults to 5.
         length (int, optional): Length of the bar in characters. Defaults to 10.
 
     Returns:
         str: A formatted progress bar string (e.g. [███-------] 3/5).
     """
-    progress = min(streak, max_streak) / max_streak
-    filled = int(progress * length)
+    if type(streak) is int and type(max_streak) is int:
+        if max_streak == 5 and length == 10 and 0 <= streak <= 5:
+            # Common case → use the precomputed table
+            return _BARS[streak]
+        filled = min(streak, max_streak) * length // max_streak   # Integer-only arithmetic
+    else:
+        # Non-int values (e.g. floats) keep the float formula
+        filled = int(min(streak, max_streak) / max_streak * length)
     bar = "█" * filled + "-" * (length - filled)
     return f"[{bar}] {streak}/{max_streak}"
 
 #==============================================================================================================#
 
-def show_status(info):
+def show_status(score=0, win_streak=0, total_attempts=0, final=False, reason="exit", out=None):
     """
     Show the current or final game status.
 
     Args:
-        info (dict): Contains game information such as:
-            - score (int): Total correct guesses.
-            - total_attempts (int): Total guesses across all rounds.
-            - win_streak (int): Current consecutive wins.
-            - final (bool): Whether to show final status.
-            - reason (str): Reason for ending the game.
-              Options: "win5", "lost", "exit".
+        score (int, optional): Total correct guesses. Defaults to 0.
+        win_streak (int, optional): Current consecutive wins. Defaults to 0.
+        total_attempts (int, optional): Total guesses across all rounds. Defaults to 0.
+        final (bool, optional): Whether to show final status. Defaults to False.
+        reason (str, optional): Reason for ending the game.
+            Options: "win5", "lost", "exit". Defaults to "exit".
+        out (optional): Binary stdout stream. Defaults to the current sys.stdout.
     """
-    if info.get("final", False):
-        reason = info.get("reason", "exit")
+    if out is None:
+        out = _stdout_bytes()
+
+    if final:
+        lines = []
 
         if reason == "win5":
             # Case: Player won 5 games in a row
-            print("🏆🔥 Congratulations! You won 5 games in a row!!")
-            print(f"Final score: {info.get('score', 0)}, Total attempts: {info.get('total_attempts', 0)}")
-            print("👋 Thanks for playing, you're a champion!")
+            lines.append("🏆🔥 Congratulations! You won 5 games in a row!!")
+            lines.append(f"Final score: {score}, Total attempts: {total_attempts}")
+            lines.append("👋 Thanks for playing, you're a champion!")
 
         elif reason == "lost":
             # Case: Player failed a round
-            print("💀 Game Over: You lost the last round.")
-            print(f"Final score: {info.get('score', 0)}, Total attempts: {info.get('total_attempts', 0)}")
-            if info.get("win_streak", 0) < 5:
-                print("🔥 Win Streak Progress:", progress_bar(info.get("win_streak", 0)))
-            print("👋 Better luck next time!")
+            lines.append("💀 Game Over: You lost the last round.")
+            lines.append(f"Final score: {score}, Total attempts: {total_attempts}")
+            if win_streak < 5:
+                lines.append(f"🔥 Win Streak Progress: {progress_bar(win_streak)}")
+            lines.append("👋 Better luck next time!")
 
         elif reason == "exit":
             # Case: Player quit voluntarily
-            print("👋 You exited the game.")
-            if info.get("total_attempts", 0) > 0:
-                print(f"Final score: {info.get('score', 0)}, Total attempts: {info.get('total_attempts', 0)}")
-                if info.get("win_streak", 0) < 5:
-                    print("🔥 Win Streak Progress:", progress_bar(info.get("win_streak", 0)))
+            lines.append("👋 You exited the game.")
+            if total_attempts > 0:
+                lines.append(f"Final score: {score}, Total attempts: {total_attempts}")
+                if win_streak < 5:
+                    lines.append(f"🔥 Win Streak Progress: {progress_bar(win_streak)}")
+
+        if lines:
+            # Emit the whole summary in a single write
+            out.write(("\n".join(lines) + "\n").encode("utf-8"))
 
     else:
-        # Ongoing game status
-        print(f"📊 Score so far: {info.get('score', 0)}")
-        print("🔥 Win Streak Progress:", progress_bar(info.get("win_streak", 0)))
+        # Ongoing game status (single write)
+        out.write((
+            f"📊 Score so far: {score}\n"
+            f"🔥 Win Streak Progress: {progress_bar(win_streak)}\n"
+        ).encode("utf-8"))
 #==============================================================================================================#
 
 # ---- Main Game Flow ----
-print("🎮 Welcome to the Guessing Number Game!")
-play_game = get_yes_no("Do you want to play? (yes/no): ")
+def main():
+    """
+    Run the game with buffered output, restoring sys.stdout afterwards.
+    """
+    original_stdout = sys.stdout
+    _buffer_stdout()        # Larger output buffer when piped/redirected
+    out = _stdout_bytes()   # Resolved once, after the stdout setup
+    try:
+        _play(out)
+    finally:
+        out.flush()
+        sys.stdout = original_stdout
 
-game_over_reason = "exit"  # Default reason if player quits immediately
+#-------------------------------------------------------------------------#
 
-while play_game == "yes":
-    number = random.randint(1, 10)   # Random target number
-    attempts_in_round = 0            # Reset attempts per round
-    guessed = False                  # Track if the number was guessed
+def _play(out):
+    """
+    Run the interactive game loop until the player wins, loses or exits.
 
-    # Each round allows up to 3 attempts
-    for _ in range(3):
-        guess = get_user_guess()
-        attempts_in_round += 1
-        total_attempts += 1
+    All game state lives in local variables of this function.
 
-        if guess == number:
+    Args:
+        out: Binary stdout stream all game output is written to.
+    """
+    score = 0              # Total number of correct guesses
+    total_attempts = 0     # Total number of guesses across all rounds
+    win_streak = 0         # Number of consecutive round wins
+
+    rng = _make_rng()   # Dedicated RNG for this session
+
+    # Prefetched batch of target numbers and the index of the next unused one
+    target_buf = rng.choices(range(1, 11), k=TARGET_BUFFER_SIZE)
+    target_cursor = 0
+
+    out.write(_B_WELCOME)
+    play_game = get_yes_no(_B_PLAY_PROMPT, out)
+
+    game_over_reason = "exit"  # Default reason if player quits immediately
+
+    while play_game == "yes":
+        number = target_buf[target_cursor]   # Random target number
+        target_cursor += 1
+        if target_cursor == TARGET_BUFFER_SIZE:
+            # Buffer exhausted → generate a fresh batch of targets
+            target_buf = rng.choices(range(1, 11), k=TARGET_BUFFER_SIZE)
+            target_cursor = 0
+
+        # Each round allows up to 3 attempts (unrolled, stops at the first hit)
+        guessed = _attempt(number, out)
+        attempts_in_round = 1
+        if not guessed:
+            guessed = _attempt(number, out)
+            attempts_in_round = 2
+            if not guessed:
+                guessed = _attempt(number, out)
+                attempts_in_round = 3
+        total_attempts += attempts_in_round   # Bookkeeping once per round
+
+        if guessed:
             # Correct guess
             score += 1
             win_streak += 1
-            guessed = True
-            print("🎉 Correct!")
-            show_status({
-                "score": score,
-                "win_streak": win_streak
-            })
-            break
+            out.write(_B_CORRECT)
+            show_status(score=score, win_streak=win_streak, out=out)
         else:
-            # Wrong guess → provide hint
-            print("⬆️ Higher!" if guess < number else "⬇️ Lower!")
-
-    if not guessed:
-        # Player used all 3 attempts → round lost
-        print(f"😢 Out of tries! The number was {number}.")
-        win_streak = 0
-        game_over_reason = "lost"
-        break
-
-    # Check if player reached 5 consecutive wins
-    if win_streak >= 5:
-        game_over_reason = "🎉 5 consecutive wins achieved"
-        break
-
-    # Ask if player wants to continue
-    play_game = get_yes_no("Play again? (yes/no): ")
-    if play_game == "no":
-        game_over_reason = "exit"
-
-# Show final game summary
-show_status({
-    "final": True,
-    "reason": game_over_reason,
-    "score": score,
-    "total_attempts": total_attempts,
-    "win_streak": win_streak
-})
+            # Player used all 3 attempts → round lost
+            out.write(f"😢 Out of tries! The number was {number}.\n".encode("utf-8"))
+            win_streak = 0
+            game_over_reason = "lost"
+            break
+
+        # Check if player reached 5 consecutive wins
+        if win_streak >= 5:
+            game_over_reason = "🎉 5 consecutive wins achieved"
+            break
+
+        # Ask if player wants to continue
+        play_game = get_yes_no(_B_AGAIN_PROMPT, out)
+        if play_game == "no":
+            game_over_reason = "exit"
+
+    # Show final game summary
+    show_status(
+        score=score,
+        win_streak=win_streak,
+        total_attempts=total_attempts,
+        final=True,
+        reason=game_over_reason,
+        out=out,
+    )
+
+
+if __name__ == "__main__":
+    main()